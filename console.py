@@ -14,16 +14,23 @@ from unpacker import Unpacker
 class Console:
     FORMAT = '%(message)s'
     VERBOSE = 'v'
+    STREAM = 's'
+    MEMORY_LIMIT = 'MEMORY'
+    DEFAULT_MEMORY_LIMIT = 1 << 16
     LOG = 'modlib.log'
     WORKING_DIR = Path('.')
     PROJECT_SUFFIX = '_unpacked'
 
     def __init__(self, args: tuple):
         self.flags = set()
+        self.options = dict()
         paths = self._parse_args(args)
         self._set_up_logger()
-        modules = self.load_paths(paths)
-        self.unpack_data(modules)
+        if self.STREAM in self.flags or self.MEMORY_LIMIT in self.options:
+            self.stream_paths(paths, self._memory_limit())
+        else:
+            modules = self.load_paths(paths)
+            self.unpack_data(modules)
 
     @staticmethod
     def load_paths(paths: list) -> list:
@@ -44,6 +51,22 @@ class Console:
 
         return loaded_modules
 
+    def stream_paths(self, paths: list, memory_limit: int):
+        """Load and unpack modules one by one, so only a single module and
+        a single sample chunk of memory_limit bytes are kept in memory."""
+        logging.debug('STREAMING:')
+
+        for path in paths:
+            if path.is_file():
+                try:
+                    module = Loader.load_file(path, stream=True,
+                                              chunk_size=memory_limit)
+                    if module:
+                        self.unpack_data([module])
+                except Loader.ModuleLoaderError:
+                    msg = "Cannot load path: %s" % str(path)
+                    logging.error(msg)
+
     def unpack_data(self, modules: list):
         logging.debug('UNPACKING:')
 
@@ -70,7 +93,10 @@ class Console:
     def _parse_args(self, args: tuple) -> list:
         paths = []
         for arg in args:
-            if arg.startswith('--'):
+            if arg.startswith('--') and '=' in arg:
+                key, value = arg[2:].split('=', 1)
+                self.options[key.upper()] = value
+            elif arg.startswith('--'):
                 self.flags.add(arg[2:].upper())
             elif arg.startswith('-'):
                 for letter in arg[1:]:
@@ -79,6 +105,19 @@ class Console:
                 paths.extend(list(self.WORKING_DIR.glob(arg)))
         return paths
 
+    def _memory_limit(self) -> int:
+        value = self.options.get(self.MEMORY_LIMIT, self.DEFAULT_MEMORY_LIMIT)
+        try:
+            limit = int(value)
+            if limit <= 0:
+                raise ValueError
+        except ValueError:
+            msg = "Wrong memory limit: %s, using %d bytes" % (
+                value, self.DEFAULT_MEMORY_LIMIT)
+            logging.error(msg)
+            limit = self.DEFAULT_MEMORY_LIMIT
+        return limit
+
     def _set_up_logger(self):
         if self.VERBOSE in self.flags:
             logging.basicConfig(level=logging.DEBUG, format=self.FORMAT,
@@ -2,7 +2,7 @@ import struct
 import string
 import logging
 
-from typing import Optional
+from typing import Iterator, Optional, Tuple
 
 from .module_format import ModuleFormat
 from . import ModuleFormatMeta
@@ -48,8 +48,11 @@ class UltimateSoundtracker(ModuleFormat, metaclass=ModuleFormatMeta):
     _guess_bytes = {}
 
     @classmethod
-    def load(cls, data: bytes) -> dict:
-        """Load module data from a file."""
+    def load(cls, data: bytes, stream: bool = False,
+             chunk_size: Optional[int] = None) -> dict:
+        """Load module data from a file. In a stream mode sample bodies are
+        not attached to the module, a generator of them is put under the
+        'stream' key instead (see iter_samples)."""
         logging.debug('=====Loading an %s module=====' % cls.name)
         module = dict()
         try:
@@ -81,14 +84,20 @@ class UltimateSoundtracker(ModuleFormat, metaclass=ModuleFormatMeta):
                 logging.debug('Offset %d:%d' % (offset, end))
                 module['patterns'][i] = cls._load_pattern(data[offset:end])
 
-            for i, sample in module['samples'].items():
-                if not sample or not sample['length']:
-                    continue
-                logging.debug('---Loading raw data for sample #%d' % i)
-                offset = end
-                end = offset + sample['length']
-                logging.debug('Offset %d:%d' % (offset, end))
-                sample['data'] = cls._load_raw(data[offset:end])
+            if stream:
+                module['stream'] = cls.iter_samples(
+                    data, module['samples'], end, chunk_size)
+                end += sum(sample['length'] for sample in
+                           module['samples'].values() if sample)
+            else:
+                for i, sample in module['samples'].items():
+                    if not sample or not sample['length']:
+                        continue
+                    logging.debug('---Loading raw data for sample #%d' % i)
+                    offset = end
+                    end = offset + sample['length']
+                    logging.debug('Offset %d:%d' % (offset, end))
+                    sample['data'] = cls._load_raw(data[offset:end])
 
             if len(data) > end:
                 s = "Some data left at the end of the file. This can't be " \
@@ -105,6 +114,33 @@ class UltimateSoundtracker(ModuleFormat, metaclass=ModuleFormatMeta):
         logging.debug('===========SUCCESS===========')
         return module
 
+    @classmethod
+    def iter_samples(cls, data: bytes, samples: dict, offset: int,
+                     chunk_size: Optional[int] = None
+                     ) -> Iterator[Tuple[int, bytes]]:
+        """Yield (sample number, raw data chunk) pairs for the sample bodies
+        starting at the offset. Each body is sliced into chunks of at most
+        chunk_size bytes (rounded down to whole frames), so only one chunk
+        is held in memory at a time."""
+        frame_size = cls.sample_width * cls.channels
+        for i, sample in samples.items():
+            if not sample or not sample['length']:
+                continue
+            logging.debug('---Streaming raw data for sample #%d' % i)
+            end = min(offset + sample['length'], len(data))
+            logging.debug('Offset %d:%d' % (offset, end))
+            if offset >= end:
+                s = "POSSIBLY corrupt data: end of file reached while " \
+                    "scanning"
+                logging.warning(s)
+                return
+            cls._validate_raw_pads(data[offset], data[end - 1])
+            step = chunk_size or sample['length']
+            step = max(step - step % frame_size, frame_size)
+            for start in range(offset, end, step):
+                yield i, data[start:min(start + step, end)]
+            offset = end
+
     @classmethod
     def _load_sample_headers(cls, data: bytes) -> Optional[dict]:
 
@@ -239,13 +275,17 @@ class UltimateSoundtracker(ModuleFormat, metaclass=ModuleFormatMeta):
 
     @classmethod
     def _load_raw(cls, data: bytes) -> bytes:
-        if data[0] != 0:
+        cls._validate_raw_pads(data[0], data[-1])
+        return data
+
+    @classmethod
+    def _validate_raw_pads(cls, first: int, last: int):
+        if first != 0:
             s = 'No zero pad at the start of the raw sample data.'
             logging.warning(s)
-        if data[-1] != 0:
+        if last != 0:
             s = 'No zero pad at the end of the raw sample data.'
             logging.warning(s)
-        return data
 
     @classmethod
     def _generate_zero_pads(cls):
@@ -1,3 +1,5 @@
+import mmap
+
 from pathlib import Path
 
 from formats.UST import *
@@ -15,13 +17,21 @@ class Loader:
         pass
 
     @classmethod
-    def load_file(cls, path: Path) -> dict:
+    def load_file(cls, path: Path, stream: bool = False,
+                  chunk_size: int = None) -> dict:
+        """In a stream mode the file is memory-mapped instead of being read
+        as a whole and sample bodies are left in the module 'stream'
+        generator, which releases the mapping once exhausted."""
         logging.debug("===========LOADING PATH: %s" % str(path))
 
         try:
             with open(path, 'rb') as mod_file:
-                data = mod_file.read()
-        except (IOError, OSError):
+                if stream and path.stat().st_size:
+                    data = mmap.mmap(mod_file.fileno(), 0,
+                                     access=mmap.ACCESS_READ)
+                else:
+                    data = mod_file.read()
+        except (IOError, OSError, ValueError):
             s = "%s cannot be read" % str(path)
             logging.error(s)
             raise cls.ModuleLoaderError(s)
@@ -49,10 +59,23 @@ class Loader:
         for module_format in zero_bytes_compatible:
             try:
                 logging.debug('Trying to load as %s' % module_format.name)
-                module = module_format.load(data)
+                module = module_format.load(data, stream=stream,
+                                            chunk_size=chunk_size)
             except module_format.ModuleFormatError:
                 continue
             else:
                 module['format'] = module_format
                 module['filename'] = path.name
+                if isinstance(data, mmap.mmap):
+                    module['stream'] = cls._closing(module['stream'], data)
                 return module
+
+        if isinstance(data, mmap.mmap):
+            data.close()
+
+    @staticmethod
+    def _closing(samples, data: mmap.mmap):
+        try:
+            yield from samples
+        finally:
+            data.close()
@@ -19,15 +19,48 @@ class Unpacker:
         return ''.join([s for s in name if s in cls.safe_characters])
 
     @classmethod
-    def encode_wav(cls, filepath: str, data: bytes, sample_width: int,
-                   sample_rate: int, channels: int):
+    def open_wav(cls, filepath: str, sample_width: int, sample_rate: int,
+                 channels: int) -> wave.Wave_write:
         wav = wave.open(filepath, 'wb')
         wav.setnchannels(channels)
         wav.setsampwidth(sample_width)
         wav.setframerate(sample_rate)
+        return wav
+
+    @classmethod
+    def encode_wav(cls, filepath: str, data: bytes, sample_width: int,
+                   sample_rate: int, channels: int):
+        wav = cls.open_wav(filepath, sample_width, sample_rate, channels)
         wav.writeframes(data)
         wav.close()
 
+    @classmethod
+    def stream_wav(cls, data: dict, sample_path: Path):
+        """Write sample chunks from the module 'stream' generator to wav
+        files as soon as they are parsed, keeping none of them around."""
+        module_format = data['format']
+        wav, current = None, None
+        try:
+            for i, chunk in data.pop('stream'):
+                if i != current:
+                    if wav:
+                        wav.close()
+                    sample = data['samples'][i]
+                    name = cls.make_a_filename(sample['name'])
+                    audio_name = "%02d %s.wav" % (i + 1, name)
+                    audio_path = sample_path / audio_name
+                    wav = cls.open_wav(
+                        str(audio_path),
+                        sample_width=module_format.sample_width,
+                        sample_rate=module_format.sample_rate,
+                        channels=module_format.channels)
+                    sample['data'] = sample_path.suffix + audio_name
+                    current = i
+                wav.writeframes(chunk)
+        finally:
+            if wav:
+                wav.close()
+
     @classmethod
     def unpack(cls, data: dict, project_path: Path, sample_path: Path):
         logging.debug('Unpacking module data.')
@@ -35,10 +68,12 @@ class Unpacker:
         module_format = data['format']
 
         try:
-            for i, sample in data['samples'].items():
-                if not sample or not sample['data']:
-                    continue
-                else:
+            if 'stream' in data:
+                cls.stream_wav(data, sample_path)
+            else:
+                for i, sample in data['samples'].items():
+                    if not sample or not sample['data']:
+                        continue
                     name = cls.make_a_filename(sample['name'])
                     audio_name = "%02d %s.wav" % (i + 1, name)
                     audio_path = sample_path / audio_name